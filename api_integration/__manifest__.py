@@ -27,6 +27,7 @@
         'base',
         'product',
         'purchase',
+        'stock',
         'point_of_sale',
     ],
     'data': [
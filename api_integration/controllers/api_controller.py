@@ -1,18 +1,115 @@
 # -*- coding: utf-8 -*-
 
+import copy
+import hashlib
 import json
 import logging
+import random
+import time
+from contextlib import contextmanager
+from datetime import timedelta
+
+import psycopg2
+
 from odoo import http, fields
 from odoo.http import request
 from odoo.exceptions import AccessError, ValidationError
+from odoo.service.model import MAX_TRIES_ON_CONCURRENCY_FAILURE, PG_CONCURRENCY_EXCEPTIONS_TO_RETRY
+from odoo.sql_db import db_connect
+from odoo.tools.profiler import ExecutionContext, Profiler
 
 _logger = logging.getLogger(__name__)
 
+# Maximum number of sub-requests accepted by /api/v1/batch
+MAX_BATCH_REQUESTS = 20
+
+# Read endpoints that may be combined in /api/v1/batch, mapped to their data helpers
+BATCH_HANDLERS = {
+    '/api/v1/health': '_get_health_data',
+    '/api/v1/uom': '_get_uom_data',
+    '/api/v1/products': '_get_products_data',
+    '/api/v1/vendors': '_get_vendors_data',
+    '/api/v1/stock': '_get_stock_data',
+}
+
+# Page size of /api/v1/stock in cursor mode
+DEFAULT_STOCK_LIMIT = 1000
+MAX_STOCK_LIMIT = 10000
+# Safety margin subtracted from server_time. On the primary, server_time is already bounded by the
+# oldest running transaction; on a replica, whose primary transactions are not visible, this margin
+# is the only protection and covers writer transactions shorter than it
+STOCK_UPDATED_SINCE_OVERLAP = timedelta(seconds=120)
+
+# Read replica used by the GET catalog endpoints (ir.config_parameter keys)
+REPLICA_URI_PARAM = 'api_integration.replica_uri'
+REPLICA_MAX_LAG_PARAM = 'api_integration.replica_max_lag'
+DEFAULT_REPLICA_MAX_LAG = 30  # seconds
+
+# A replica is caught up only while it streams from the primary (a recent message within the
+# maximum lag) and has replayed all it received. A disconnected replica also has nothing left to
+# replay, so the receiver status is what tells it apart. Reading pg_stat_wal_receiver requires
+# the pg_read_all_stats role, without it the replica is never considered caught up
+REPLICA_CAUGHT_UP_CONDITION = """
+    pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn()
+    AND EXISTS (
+        SELECT 1 FROM pg_stat_wal_receiver
+        WHERE status = 'streaming'
+          AND last_msg_receipt_time >= now() - make_interval(secs => %(max_lag)s)
+    )
+"""
+
+# Replication lag in seconds, NULL when the replica has not replayed any transaction yet
+REPLICA_LAG_QUERY = f"""
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN {REPLICA_CAUGHT_UP_CONDITION} THEN 0
+        ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp())
+    END
+"""
+
+# Time up to which the current database holds the primary's data: on the primary the start of the
+# oldest running transaction, now() on a caught-up replica, otherwise the commit time of the last
+# transaction the replica replayed
+DATA_TIME_QUERY = f"""
+    SELECT (CASE
+        -- write_date is a transaction start time: changes not committed yet carry a write_date
+        -- of at least the oldest running transaction's start
+        WHEN NOT pg_is_in_recovery() THEN LEAST(now(), (
+            SELECT MIN(xact_start) FROM pg_stat_activity
+            WHERE datname = current_database() AND xact_start IS NOT NULL
+        ))
+        WHEN {REPLICA_CAUGHT_UP_CONDITION} THEN now()
+        ELSE COALESCE(pg_last_xact_replay_timestamp(), 'epoch'::timestamptz)
+    END) AT TIME ZONE 'UTC'
+"""
+
+# Collectors of on-demand request profiles: SQL queries with timings and sampled Python stacks
+PROFILER_COLLECTORS = ['sql', 'traces_async']
+
+# Backoff before retrying a concurrency failure: random wait in [0, min(MAX, BASE * 2 ** tries)] seconds
+BASE_WAIT_BEFORE_RETRY = 0.05
+MAX_WAIT_BEFORE_RETRY = 1.0
+
+# Tables holding the reference data of /api/v1/pos/bootstrap, used to compute its version token
+POS_BOOTSTRAP_TABLES = (
+    'uom_uom',
+    'uom_category',
+    'res_currency',
+    'res_currency_rate',
+    'res_company',
+    'product_pricelist',
+    'account_tax',
+    'account_fiscal_position',
+    'account_fiscal_position_tax',
+    'pos_payment_method',
+    'pos_config',
+)
+
 
 class APIController(http.Controller):
     """REST API Controller for pushing Odoo data"""
 
-    def _authenticate(self, api_key=None):
+    def _authenticate(self, api_key=None, track_usage=True):
         """Authenticate API request using API key"""
         if not api_key:
             return None
@@ -23,11 +120,32 @@ class APIController(http.Controller):
             return None
         
         # Update usage statistics
-        config.update_usage()
+        if track_usage:
+            config.update_usage()
         
         return config
 
-    def _json_response(self, data, status=200, error=None):
+    def _update_usage_isolated(self, config):
+        """
+        Update usage statistics in a transaction of their own
+        
+        The api_config row is shared by every terminal using the key. Writing
+        it from a separate, immediately committed cursor keeps it out of the
+        caller's transaction, so its conflicts are neither retried with nor
+        rolled back by the caller's work.
+        """
+        for tries in range(1, MAX_TRIES_ON_CONCURRENCY_FAILURE + 1):
+            try:
+                with request.env.registry.cursor() as cr:
+                    config.with_env(config.env(cr=cr)).update_usage()
+                return
+            except PG_CONCURRENCY_EXCEPTIONS_TO_RETRY as e:
+                if tries >= MAX_TRIES_ON_CONCURRENCY_FAILURE:
+                    _logger.warning(f"Could not update usage of API configuration {config.id}: {str(e)}")
+                    return
+                time.sleep(random.uniform(0.0, min(MAX_WAIT_BEFORE_RETRY, BASE_WAIT_BEFORE_RETRY * 2 ** tries)))
+
+    def _json_response(self, data, status=200, error=None, headers=None):
         """Return JSON response"""
         response_data = {
             'status': 'success' if status == 200 else 'error',
@@ -35,11 +153,492 @@ class APIController(http.Controller):
             'error': error if error else None,
             'count': len(data) if isinstance(data, list) else (1 if data else 0),
         }
-        return request.make_response(
-            json.dumps(response_data, default=str),
-            headers=[('Content-Type', 'application/json')],
-            status=status
+        with ExecutionContext(phase='encode'):
+            return request.make_response(
+                json.dumps(response_data, default=str),
+                headers=[('Content-Type', 'application/json')] + (headers or []),
+                status=status
+            )
+
+    @contextmanager
+    def _profile_request(self, config, endpoint, params):
+        """
+        Profile the enclosed block when the API configuration asks for it
+        
+        The profile (SQL queries with timings, sampled Python stacks and the
+        read/encode phases) is stored as an API request profile of the
+        configuration, which applies its retention limits. Requests that
+        raise are stored too, with the error.
+        """
+        if not config._should_profile(endpoint):
+            yield
+            return
+        
+        profiler = Profiler(
+            db=None,
+            collectors=PROFILER_COLLECTORS,
+            description=f'{endpoint} ({config.name})',
         )
+        error = None
+        try:
+            with profiler:
+                yield
+        except Exception as e:
+            error = e
+            raise
+        finally:
+            try:
+                profile = json.loads(profiler.json())
+                profile['endpoint'] = endpoint
+                profile['params'] = {key: value for key, value in params.items() if key != 'api_key'}
+                profile['error'] = repr(error) if error else None
+                # Own cursor: a failed request's transaction may be aborted or rolled back
+                with request.env.registry.cursor() as cr:
+                    config.with_env(config.env(cr=cr))._store_profile(
+                        endpoint,
+                        json.dumps(profile, default=str),
+                        duration=profile.get('duration'),
+                        error=profile['error'],
+                    )
+            except Exception as e:
+                _logger.error(f"Error storing profile of {endpoint}: {str(e)}")
+
+    def _get_replica_max_lag(self):
+        """Return the maximum accepted replication lag, in seconds"""
+        params = request.env['ir.config_parameter'].sudo()
+        return float(params.get_param(REPLICA_MAX_LAG_PARAM, DEFAULT_REPLICA_MAX_LAG))
+
+    def _get_replica_cursor(self):
+        """
+        Open a cursor on the read replica, or return None to use the primary
+        
+        The replica is skipped when it is not configured, cannot be reached,
+        serves another database or lags more than the configured maximum.
+        """
+        params = request.env['ir.config_parameter'].sudo()
+        replica_uri = params.get_param(REPLICA_URI_PARAM)
+        if not replica_uri:
+            return None
+        max_lag = self._get_replica_max_lag()
+        
+        try:
+            replica_cr = db_connect(replica_uri, allow_uri=True, readonly=True).cursor()
+        except psycopg2.Error as e:
+            _logger.warning(f"Read replica unavailable, using primary: {str(e)}")
+            return None
+        
+        try:
+            if replica_cr.dbname != request.env.cr.dbname:
+                _logger.warning(f"Read replica serves database {replica_cr.dbname} instead of "
+                                f"{request.env.cr.dbname}, using primary")
+                replica_cr.close()
+                return None
+            replica_cr.execute(REPLICA_LAG_QUERY, {'max_lag': max_lag})
+            lag = replica_cr.fetchone()[0]
+        except psycopg2.Error as e:
+            _logger.warning(f"Read replica lag check failed, using primary: {str(e)}")
+            replica_cr.close()
+            return None
+        
+        if lag is None or float(lag) > max_lag:
+            _logger.warning(f"Read replica lags {lag}s (max {max_lag:.1f}s), using primary")
+            replica_cr.close()
+            return None
+        
+        # End the lag check transaction so that reads start from a fresh snapshot
+        replica_cr.rollback()
+        return replica_cr
+
+    def _read_from_replica(self, method, /, **params):
+        """
+        Call a data helper with request.env bound to the read replica
+        
+        Falls back to the primary when the replica is not usable or fails
+        while reading. Callers must authenticate beforehand so that usage
+        tracking and any other write happens on the primary.
+        """
+        replica_cr = self._get_replica_cursor()
+        if replica_cr is None:
+            with ExecutionContext(phase='read'):
+                return method(**params)
+        
+        primary_env = request.env
+        try:
+            request.env = primary_env(cr=replica_cr)
+            with ExecutionContext(phase='read', database='replica'):
+                return method(**params)
+        except (psycopg2.OperationalError, psycopg2.InterfaceError) as e:
+            # Replica went away or cancelled the query (e.g. conflict with recovery)
+            _logger.warning(f"Read replica failed during {method.__name__}, retrying on primary: {str(e)}")
+        finally:
+            request.env = primary_env
+            replica_cr.close()
+        with ExecutionContext(phase='read'):
+            return method(**params)
+
+    def _get_uom_data(self, limit=None, offset=0, **kwargs):
+        """Serialize Unit of Measures"""
+        # Get UoM records
+        uom_env = request.env['uom.uom'].sudo()
+        domain = []
+        
+        # Apply limit and offset
+        limit = int(limit) if limit else None
+        offset = int(offset) if offset else 0
+        
+        uoms = uom_env.search(domain, limit=limit, offset=offset, order='name')
+        
+        # Serialize data
+        data = []
+        for uom in uoms:
+            data.append({
+                'id': uom.id,
+                'name': uom.name,
+                'category_id': {
+                    'id': uom.category_id.id if uom.category_id else None,
+                    'name': uom.category_id.name if uom.category_id else None,
+                },
+                'factor': uom.factor,
+                'factor_inv': uom.factor_inv,
+                'rounding': uom.rounding,
+                'uom_type': uom.uom_type,
+                'active': uom.active,
+            })
+        
+        return data
+
+    def _get_products_data(self, limit=None, offset=0, active_only='true', **kwargs):
+        """Serialize Product Templates with their variants and suppliers"""
+        # Get Product Templates
+        product_env = request.env['product.template'].sudo()
+        domain = []
+        
+        # Handle active_only parameter - can be string or boolean
+        if active_only:
+            if isinstance(active_only, bool):
+                active_filter = active_only
+            elif isinstance(active_only, str):
+                active_filter = active_only.lower() not in ('false', '0', 'no', '')
+            else:
+                active_filter = True
+            
+            if active_filter:
+                domain.append(('active', '=', True))
+        
+        # Apply limit and offset
+        limit = int(limit) if limit else None
+        offset = int(offset) if offset else 0
+        
+        products = product_env.search(domain, limit=limit, offset=offset, order='name')
+        
+        # Serialize data
+        data = []
+        for product in products:
+            # Get product variants
+            variants = []
+            for variant in product.product_variant_ids:
+                variants.append({
+                    'id': variant.id,
+                    'default_code': variant.default_code or '',
+                    'barcode': variant.barcode or '',
+                    'weight': float(variant.weight) if variant.weight else 0.0,
+                    'volume': float(variant.volume) if variant.volume else 0.0,
+                })
+            
+            # Get categories (categ_id is Many2one, so single category)
+            categories = []
+            if product.categ_id:
+                categories.append({
+                    'id': product.categ_id.id,
+                    'name': product.categ_id.complete_name or product.categ_id.name or '',
+                })
+            
+            # Get suppliers (vendors)
+            suppliers = []
+            for supplier in product.seller_ids:
+                if supplier.partner_id:  # Only add if partner exists
+                    suppliers.append({
+                        'id': supplier.partner_id.id,
+                        'name': supplier.partner_id.name or '',
+                        'price': float(supplier.price) if supplier.price else 0.0,
+                        'currency_id': {
+                            'id': supplier.currency_id.id if supplier.currency_id else None,
+                            'name': supplier.currency_id.name if supplier.currency_id else None,
+                        },
+                        'min_qty': float(supplier.min_qty) if supplier.min_qty else 0.0,
+                        'delay': int(supplier.delay) if supplier.delay else 0,
+                    })
+            
+            product_data = {
+                'id': product.id,
+                'name': product.name or '',
+                'description': product.description or '',
+                'description_purchase': product.description_purchase or '',
+                'description_sale': product.description_sale or '',
+                'type': product.type or 'consu',  # 'consu', 'service', 'storable'
+                'categ_id': {
+                    'id': product.categ_id.id if product.categ_id else None,
+                    'name': product.categ_id.name if product.categ_id else None,
+                },
+                'categories': categories,
+                'list_price': float(product.list_price) if product.list_price else 0.0,
+                'standard_price': float(product.standard_price) if product.standard_price else 0.0,
+                'uom_id': {
+                    'id': product.uom_id.id if product.uom_id else None,
+                    'name': product.uom_id.name if product.uom_id else None,
+                },
+                'uom_po_id': {
+                    'id': product.uom_po_id.id if product.uom_po_id else None,
+                    'name': product.uom_po_id.name if product.uom_po_id else None,
+                },
+                'barcode': product.barcode or '',
+                'default_code': product.default_code or '',
+                'sale_ok': product.sale_ok or False,
+                'purchase_ok': product.purchase_ok or False,
+                'active': product.active or False,
+                'weight': float(product.weight) if product.weight else 0.0,
+                'volume': float(product.volume) if product.volume else 0.0,
+                'variants': variants,
+                'suppliers': suppliers,
+            }
+            
+            # Add image if available
+            if product.image_1920:
+                product_data['image_url'] = f'/web/image/product.template/{product.id}/image_1920'
+            
+            data.append(product_data)
+        
+        return data
+
+    def _get_vendors_data(self, limit=None, offset=0, active_only='true', **kwargs):
+        """Serialize Vendor Partners with their products and tax mappings"""
+        # Get Vendor Partners (suppliers)
+        partner_env = request.env['res.partner'].sudo()
+        domain = [
+            ('is_company', '=', True),
+            ('supplier_rank', '>', 0),
+        ]
+        
+        # Handle active_only parameter - can be string or boolean
+        if active_only:
+            if isinstance(active_only, bool):
+                active_filter = active_only
+            elif isinstance(active_only, str):
+                active_filter = active_only.lower() not in ('false', '0', 'no', '')
+            else:
+                active_filter = True
+            
+            if active_filter:
+                domain.append(('active', '=', True))
+        
+        # Apply limit and offset
+        limit = int(limit) if limit else None
+        offset = int(offset) if offset else 0
+        
+        vendors = partner_env.search(domain, limit=limit, offset=offset, order='name')
+        
+        # Serialize data
+        data = []
+        for vendor in vendors:
+            # Get vendor's products from product.supplierinfo (seller_ids)
+            # Search for supplierinfo records where this vendor is the partner
+            supplierinfo_env = request.env['product.supplierinfo'].sudo()
+            supplier_infos = supplierinfo_env.search([('partner_id', '=', vendor.id)])
+            
+            products = []
+            for seller in supplier_infos:
+                # Get product from supplierinfo
+                product = seller.product_id or (seller.product_tmpl_id.product_variant_id if seller.product_tmpl_id else None)
+                if product:
+                    products.append({
+                        'id': product.id,
+                        'name': product.name or '',
+                        'product_code': seller.product_code or '',
+                        'price': float(seller.price) if seller.price else 0.0,
+                        'min_qty': float(seller.min_qty) if seller.min_qty else 0.0,
+                        'delay': int(seller.delay) if seller.delay else 0,
+                        'currency_id': {
+                            'id': seller.currency_id.id if seller.currency_id else None,
+                            'name': seller.currency_id.name if seller.currency_id else None,
+                        },
+                    })
+            
+            # Get fiscal position and tax information
+            fiscal_position = vendor.property_account_position_id
+            fiscal_position_data = None
+            tax_mappings = []
+            
+            if fiscal_position:
+                fiscal_position_data = {
+                    'id': fiscal_position.id,
+                    'name': fiscal_position.name or '',
+                    'active': fiscal_position.active,
+                }
+                
+                # Get tax mappings from fiscal position
+                for tax_mapping in fiscal_position.tax_ids:
+                    tax_mapping_data = {
+                        'tax_source': {
+                            'id': tax_mapping.tax_src_id.id if tax_mapping.tax_src_id else None,
+                            'name': tax_mapping.tax_src_id.name if tax_mapping.tax_src_id else '',
+                            'amount': float(tax_mapping.tax_src_id.amount) if tax_mapping.tax_src_id and tax_mapping.tax_src_id.amount else 0.0,
+                            'amount_type': tax_mapping.tax_src_id.amount_type if tax_mapping.tax_src_id else '',
+                            'type_tax_use': tax_mapping.tax_src_id.type_tax_use if tax_mapping.tax_src_id else '',
+                        },
+                        'tax_destination': None,
+                    }
+                    
+                    if tax_mapping.tax_dest_id:
+                        tax_mapping_data['tax_destination'] = {
+                            'id': tax_mapping.tax_dest_id.id,
+                            'name': tax_mapping.tax_dest_id.name or '',
+                            'amount': float(tax_mapping.tax_dest_id.amount) if tax_mapping.tax_dest_id.amount else 0.0,
+                            'amount_type': tax_mapping.tax_dest_id.amount_type or '',
+                            'type_tax_use': tax_mapping.tax_dest_id.type_tax_use or '',
+                            'active': tax_mapping.tax_dest_active,
+                        }
+                    
+                    tax_mappings.append(tax_mapping_data)
+            
+            vendor_data = {
+                'id': vendor.id,
+                'name': vendor.name,
+                'display_name': vendor.display_name,
+                'ref': vendor.ref or '',
+                'vat': vendor.vat or '',
+                'vat_number': vendor.vat or '',  # Explicit VAT number field
+                'company_registry': vendor.company_registry or '',  # Company registry number
+                'email': vendor.email or '',
+                'phone': vendor.phone or '',
+                'mobile': vendor.mobile or '',
+                'website': vendor.website or '',
+                'street': vendor.street or '',
+                'street2': vendor.street2 or '',
+                'city': vendor.city or '',
+                'state_id': {
+                    'id': vendor.state_id.id if vendor.state_id else None,
+                    'name': vendor.state_id.name if vendor.state_id else None,
+                    'code': vendor.state_id.code if vendor.state_id else None,
+                },
+                'zip': vendor.zip or '',
+                'country_id': {
+                    'id': vendor.country_id.id if vendor.country_id else None,
+                    'name': vendor.country_id.name if vendor.country_id else None,
+                    'code': vendor.country_id.code if vendor.country_id else None,
+                },
+                'supplier_rank': vendor.supplier_rank,
+                'active': vendor.active,
+                'fiscal_position': fiscal_position_data,
+                'tax_mappings': tax_mappings,
+                'products': products,
+            }
+            
+            # Add image if available
+            if vendor.image_1920:
+                vendor_data['image_url'] = f'/web/image/res.partner/{vendor.id}/image_1920'
+            
+            data.append(vendor_data)
+        
+        return data
+
+    def _get_stock_data(self, product_ids=None, location_id=None, warehouse_id=None,
+                        cursor=None, limit=None, updated_since=None, **kwargs):
+        """
+        Compute on-hand and available quantities of storable products
+        
+        Products are selected by explicit ids, or paged by ascending id after
+        the cursor (optionally restricted to products whose stock changed
+        since updated_since). Quantities of the whole page come from a single
+        grouped aggregate over stock.quant in internal locations.
+        
+        The returned server_time is no later than the start of the oldest
+        transaction running on the primary, minus a margin, so passing it
+        back as updated_since may return some products again. When read
+        from a replica, only the margin applies: writer transactions longer
+        than STOCK_UPDATED_SINCE_OVERLAP may be missed.
+        """
+        # Taken from the database being read, which may be a replica behind the primary
+        request.env.cr.execute(DATA_TIME_QUERY, {'max_lag': self._get_replica_max_lag()})
+        server_time = request.env.cr.fetchone()[0] - STOCK_UPDATED_SINCE_OVERLAP
+        
+        # Restrict quants to internal locations, optionally below a location or warehouse
+        quant_domain = [('location_id.usage', '=', 'internal')]
+        root_locations = request.env['stock.location']
+        if location_id:
+            location = request.env['stock.location'].sudo().browse(int(location_id))
+            if not location.exists():
+                raise ValidationError(f'Location {location_id} not found')
+            root_locations |= location
+        if warehouse_id:
+            warehouse = request.env['stock.warehouse'].sudo().browse(int(warehouse_id))
+            if not warehouse.exists():
+                raise ValidationError(f'Warehouse {warehouse_id} not found')
+            root_locations |= warehouse.view_location_id
+        for root_location in root_locations:
+            quant_domain.append(('location_id', 'child_of', root_location.id))
+        
+        product_domain = [('is_storable', '=', True)]
+        if product_ids:
+            if isinstance(product_ids, str):
+                product_ids = [pid for pid in product_ids.split(',') if pid.strip()]
+            product_domain.append(('id', 'in', [int(pid) for pid in product_ids]))
+        
+        if updated_since:
+            try:
+                since = fields.Datetime.to_datetime(updated_since)
+            except ValueError:
+                raise ValidationError(f'Invalid updated_since: {updated_since}')
+            # Quants carry reservation changes, moves also cover quants that were emptied and removed
+            changed_quants = request.env['stock.quant'].sudo()._read_group(
+                quant_domain + [('write_date', '>=', since)], groupby=['product_id'])
+            # Done moves filtered on their indexed state and date, rather than scanning write_date
+            move_domain = [
+                ('state', '=', 'done'),
+                ('date', '>=', since),
+                ('product_id.is_storable', '=', True),
+            ]
+            for root_location in root_locations:
+                move_domain += ['|', ('location_id', 'child_of', root_location.id),
+                                ('location_dest_id', 'child_of', root_location.id)]
+            changed_moves = request.env['stock.move'].sudo()._read_group(move_domain, groupby=['product_id'])
+            changed_ids = {product.id for product, in changed_quants + changed_moves}
+            product_domain.append(('id', 'in', list(changed_ids)))
+        
+        # Page products by id so the cursor stays stable while data changes
+        limit = int(limit) if limit not in (None, '') else DEFAULT_STOCK_LIMIT
+        if limit < 1:
+            raise ValidationError(f'Invalid limit: {limit}')
+        limit = min(limit, MAX_STOCK_LIMIT)
+        if cursor:
+            product_domain.append(('id', '>', int(cursor)))
+        products = request.env['product.product'].sudo().with_context(active_test=False).search(
+            product_domain, limit=limit, order='id')
+        
+        # One grouped aggregate for the whole page
+        quantities = {
+            product.id: (quantity, reserved_quantity)
+            for product, quantity, reserved_quantity in request.env['stock.quant'].sudo()._read_group(
+                quant_domain + [('product_id', 'in', products.ids)],
+                groupby=['product_id'],
+                aggregates=['quantity:sum', 'reserved_quantity:sum'],
+            )
+        }
+        
+        items = []
+        for product_id in products.ids:
+            quantity, reserved_quantity = quantities.get(product_id, (0.0, 0.0))
+            items.append({
+                'product_id': product_id,
+                'quantity': quantity,
+                'reserved_quantity': reserved_quantity,
+                'available_quantity': quantity - reserved_quantity,
+            })
+        
+        return {
+            'quantities': items,
+            'next_cursor': products.ids[-1] if len(products) == limit else None,
+            'server_time': server_time,
+        }
 
     @http.route('/api/v1/uom', type='http', auth='none', methods=['GET'], csrf=False, cors='*')
     def get_uom(self, api_key=None, limit=None, offset=0, **kwargs):
@@ -54,43 +653,20 @@ class APIController(http.Controller):
         Returns JSON with unit of measures data
         """
         try:
-            # Authenticate
-            config = self._authenticate(api_key)
+            # Authenticate, tracking usage outside the request transaction that waits on the replica read
+            config = self._authenticate(api_key, track_usage=False)
             if not config:
                 return self._json_response(
                     None,
                     status=401,
                     error='Invalid or missing API key'
                 )
+            self._update_usage_isolated(config)
             
-            # Get UoM records
-            uom_env = request.env['uom.uom'].sudo()
-            domain = []
-            
-            # Apply limit and offset
-            limit = int(limit) if limit else None
-            offset = int(offset) if offset else 0
-            
-            uoms = uom_env.search(domain, limit=limit, offset=offset, order='name')
-            
-            # Serialize data
-            data = []
-            for uom in uoms:
-                data.append({
-                    'id': uom.id,
-                    'name': uom.name,
-                    'category_id': {
-                        'id': uom.category_id.id if uom.category_id else None,
-                        'name': uom.category_id.name if uom.category_id else None,
-                    },
-                    'factor': uom.factor,
-                    'factor_inv': uom.factor_inv,
-                    'rounding': uom.rounding,
-                    'uom_type': uom.uom_type,
-                    'active': uom.active,
-                })
-            
-            return self._json_response(data)
+            with self._profile_request(config, '/api/v1/uom', request.params):
+                data = self._read_from_replica(self._get_uom_data, limit=limit, offset=offset)
+                
+                return self._json_response(data)
             
         except Exception as e:
             _logger.error(f"Error in get_uom: {str(e)}")
@@ -114,115 +690,20 @@ class APIController(http.Controller):
         Returns JSON with products data including variants
         """
         try:
-            # Authenticate
-            config = self._authenticate(api_key)
+            # Authenticate, tracking usage outside the request transaction that waits on the replica read
+            config = self._authenticate(api_key, track_usage=False)
             if not config:
                 return self._json_response(
                     None,
                     status=401,
                     error='Invalid or missing API key'
                 )
+            self._update_usage_isolated(config)
             
-            # Get Product Templates
-            product_env = request.env['product.template'].sudo()
-            domain = []
-            
-            # Handle active_only parameter - can be string or boolean
-            if active_only:
-                if isinstance(active_only, bool):
-                    active_filter = active_only
-                elif isinstance(active_only, str):
-                    active_filter = active_only.lower() not in ('false', '0', 'no', '')
-                else:
-                    active_filter = True
-                
-                if active_filter:
-                    domain.append(('active', '=', True))
-            
-            # Apply limit and offset
-            limit = int(limit) if limit else None
-            offset = int(offset) if offset else 0
-            
-            products = product_env.search(domain, limit=limit, offset=offset, order='name')
-            
-            # Serialize data
-            data = []
-            for product in products:
-                # Get product variants
-                variants = []
-                for variant in product.product_variant_ids:
-                    variants.append({
-                        'id': variant.id,
-                        'default_code': variant.default_code or '',
-                        'barcode': variant.barcode or '',
-                        'weight': float(variant.weight) if variant.weight else 0.0,
-                        'volume': float(variant.volume) if variant.volume else 0.0,
-                    })
-                
-                # Get categories (categ_id is Many2one, so single category)
-                categories = []
-                if product.categ_id:
-                    categories.append({
-                        'id': product.categ_id.id,
-                        'name': product.categ_id.complete_name or product.categ_id.name or '',
-                    })
-                
-                # Get suppliers (vendors)
-                suppliers = []
-                for supplier in product.seller_ids:
-                    if supplier.partner_id:  # Only add if partner exists
-                        suppliers.append({
-                            'id': supplier.partner_id.id,
-                            'name': supplier.partner_id.name or '',
-                            'price': float(supplier.price) if supplier.price else 0.0,
-                            'currency_id': {
-                                'id': supplier.currency_id.id if supplier.currency_id else None,
-                                'name': supplier.currency_id.name if supplier.currency_id else None,
-                            },
-                            'min_qty': float(supplier.min_qty) if supplier.min_qty else 0.0,
-                            'delay': int(supplier.delay) if supplier.delay else 0,
-                        })
-                
-                product_data = {
-                    'id': product.id,
-                    'name': product.name or '',
-                    'description': product.description or '',
-                    'description_purchase': product.description_purchase or '',
-                    'description_sale': product.description_sale or '',
-                    'type': product.type or 'consu',  # 'consu', 'service', 'storable'
-                    'categ_id': {
-                        'id': product.categ_id.id if product.categ_id else None,
-                        'name': product.categ_id.name if product.categ_id else None,
-                    },
-                    'categories': categories,
-                    'list_price': float(product.list_price) if product.list_price else 0.0,
-                    'standard_price': float(product.standard_price) if product.standard_price else 0.0,
-                    'uom_id': {
-                        'id': product.uom_id.id if product.uom_id else None,
-                        'name': product.uom_id.name if product.uom_id else None,
-                    },
-                    'uom_po_id': {
-                        'id': product.uom_po_id.id if product.uom_po_id else None,
-                        'name': product.uom_po_id.name if product.uom_po_id else None,
-                    },
-                    'barcode': product.barcode or '',
-                    'default_code': product.default_code or '',
-                    'sale_ok': product.sale_ok or False,
-                    'purchase_ok': product.purchase_ok or False,
-                    'active': product.active or False,
-                    'weight': float(product.weight) if product.weight else 0.0,
-                    'volume': float(product.volume) if product.volume else 0.0,
-                    'variants': variants,
-                    'suppliers': suppliers,
-                }
-                
-                # Add image if available
-                if product.image_1920:
-                    product_data['image_url'] = f'/web/image/product.template/{product.id}/image_1920'
+            with self._profile_request(config, '/api/v1/products', request.params):
+                data = self._read_from_replica(self._get_products_data, limit=limit, offset=offset, active_only=active_only)
                 
-                data.append(product_data)
-            
-            return self._json_response(data)
+                return self._json_response(data)
             
         except Exception as e:
             _logger.error(f"Error in get_products: {str(e)}")
@@ -246,152 +727,298 @@ class APIController(http.Controller):
         Returns JSON with vendors data
         """
         try:
-            # Authenticate
-            config = self._authenticate(api_key)
+            # Authenticate, tracking usage outside the request transaction that waits on the replica read
+            config = self._authenticate(api_key, track_usage=False)
             if not config:
                 return self._json_response(
                     None,
                     status=401,
                     error='Invalid or missing API key'
                 )
+            self._update_usage_isolated(config)
             
-            # Get Vendor Partners (suppliers)
-            partner_env = request.env['res.partner'].sudo()
-            domain = [
-                ('is_company', '=', True),
-                ('supplier_rank', '>', 0),
-            ]
-            
-            # Handle active_only parameter - can be string or boolean
-            if active_only:
-                if isinstance(active_only, bool):
-                    active_filter = active_only
-                elif isinstance(active_only, str):
-                    active_filter = active_only.lower() not in ('false', '0', 'no', '')
-                else:
-                    active_filter = True
+            with self._profile_request(config, '/api/v1/vendors', request.params):
+                data = self._read_from_replica(self._get_vendors_data, limit=limit, offset=offset, active_only=active_only)
                 
-                if active_filter:
-                    domain.append(('active', '=', True))
+                return self._json_response(data)
             
-            # Apply limit and offset
-            limit = int(limit) if limit else None
-            offset = int(offset) if offset else 0
+        except Exception as e:
+            _logger.error(f"Error in get_vendors: {str(e)}")
+            return self._json_response(
+                None,
+                status=500,
+                error=f'Internal server error: {str(e)}'
+            )
+
+    @http.route('/api/v1/stock', type='http', auth='none', methods=['GET'], csrf=False, cors='*')
+    def get_stock(self, api_key=None, **kwargs):
+        """
+        Get stock quantities of storable products
+        
+        Parameters:
+        - api_key (required): API authentication key
+        - product_ids: Comma-separated product (variant) ids
+        - location_id: Only count stock in this location and its children
+        - warehouse_id: Only count stock in this warehouse
+        - cursor: Return products with an id greater than this (from next_cursor)
+        - limit: Maximum number of products to return (default: 1000, max: 10000)
+        - updated_since: Only products whose stock changed since this UTC datetime
+        
+        Returns JSON with quantities, next_cursor and server_time
+        """
+        try:
+            # Authenticate, tracking usage outside the request transaction that waits on the replica read
+            config = self._authenticate(api_key, track_usage=False)
+            if not config:
+                return self._json_response(
+                    None,
+                    status=401,
+                    error='Invalid or missing API key'
+                )
+            self._update_usage_isolated(config)
             
-            vendors = partner_env.search(domain, limit=limit, offset=offset, order='name')
+            with self._profile_request(config, '/api/v1/stock', request.params):
+                try:
+                    data = self._read_from_replica(self._get_stock_data, **kwargs)
+                except (ValidationError, ValueError) as e:
+                    return self._json_response(
+                        None,
+                        status=400,
+                        error=str(e)
+                    )
+                
+                return self._json_response(data)
             
-            # Serialize data
-            data = []
-            for vendor in vendors:
-                # Get vendor's products from product.supplierinfo (seller_ids)
-                # Search for supplierinfo records where this vendor is the partner
-                supplierinfo_env = request.env['product.supplierinfo'].sudo()
-                supplier_infos = supplierinfo_env.search([('partner_id', '=', vendor.id)])
+        except Exception as e:
+            _logger.error(f"Error in get_stock: {str(e)}")
+            return self._json_response(
+                None,
+                status=500,
+                error=f'Internal server error: {str(e)}'
+            )
+
+    def _get_pos_bootstrap_version(self, pos_session):
+        """
+        Compute the version token of the bootstrap bundle of a POS session
+        
+        Uses the row count and latest write_date of each reference data table
+        in a single query, so revalidating a cached bundle does not require
+        reading the data itself. Any create, write or delete changes the token,
+        as do a change of the session and the current date (currency rates
+        depend on it).
+        """
+        query = ' UNION ALL '.join(
+            f"SELECT '{table}', COUNT(*), MAX(write_date) FROM {table}"
+            for table in POS_BOOTSTRAP_TABLES
+        )
+        request.env.cr.execute(query)
+        fingerprint = json.dumps([
+            pos_session.id,
+            pos_session.state,
+            pos_session.write_date,
+            pos_session.config_id.id,
+            fields.Date.context_today(pos_session),
+            request.env.cr.fetchall(),
+        ], default=str)
+        return hashlib.sha1(fingerprint.encode('utf-8')).hexdigest()[:20]
+
+    def _get_pos_bootstrap_data(self, pos_session):
+        """Serialize the reference data a terminal needs before it can sell"""
+        pos_config = pos_session.config_id
+        company = pos_config.company_id
+        
+        config_data = {
+            'id': pos_config.id,
+            'name': pos_config.name,
+            'company_id': {
+                'id': company.id,
+                'name': company.name,
+            },
+            'currency_id': pos_config.currency_id.id,
+            'pricelist_id': {
+                'id': pos_config.pricelist_id.id if pos_config.pricelist_id else None,
+                'name': pos_config.pricelist_id.name if pos_config.pricelist_id else None,
+            },
+            'default_fiscal_position_id': pos_config.default_fiscal_position_id.id or None,
+            'iface_tax_included': pos_config.iface_tax_included,
+        }
+        
+        # Rates are relative to the session company's currency and use its own rates
+        currencies = request.env['res.currency'].sudo().with_company(company).search([('active', '=', True)], order='name')
+        currencies_data = [{
+            'id': currency.id,
+            'name': currency.name,
+            'symbol': currency.symbol,
+            'position': currency.position,
+            'rounding': currency.rounding,
+            'decimal_places': currency.decimal_places,
+            'rate': currency.rate,
+        } for currency in currencies]
+        
+        taxes = request.env['account.tax'].sudo().with_company(company).search([
+            ('company_id', '=', company.id),
+            ('type_tax_use', '=', 'sale'),
+        ], order='sequence, id')
+        taxes_data = [{
+            'id': tax.id,
+            'name': tax.name,
+            'amount': tax.amount,
+            'amount_type': tax.amount_type,
+            'price_include': tax.price_include,
+            'include_base_amount': tax.include_base_amount,
+            'children_tax_ids': tax.children_tax_ids.ids,
+        } for tax in taxes]
+        
+        fiscal_positions = pos_config.fiscal_position_ids | pos_config.default_fiscal_position_id
+        fiscal_positions_data = [{
+            'id': fiscal_position.id,
+            'name': fiscal_position.name,
+            'tax_mappings': [{
+                'tax_src_id': mapping.tax_src_id.id,
+                'tax_dest_id': mapping.tax_dest_id.id or None,
+            } for mapping in fiscal_position.tax_ids],
+        } for fiscal_position in fiscal_positions]
+        
+        payment_methods_data = [{
+            'id': payment_method.id,
+            'name': payment_method.name,
+            'type': payment_method.type,
+            'is_cash_count': payment_method.is_cash_count,
+            'split_transactions': payment_method.split_transactions,
+        } for payment_method in pos_config.payment_method_ids]
+        
+        return {
+            'session': {
+                'id': pos_session.id,
+                'name': pos_session.name,
+                'state': pos_session.state,
+            },
+            'config': config_data,
+            'uoms': self._get_uom_data(),
+            'currencies': currencies_data,
+            'taxes': taxes_data,
+            'fiscal_positions': fiscal_positions_data,
+            'payment_methods': payment_methods_data,
+        }
+
+    @http.route('/api/v1/pos/bootstrap', type='http', auth='none', methods=['GET'], csrf=False, cors='*')
+    def get_pos_bootstrap(self, api_key=None, session_id=None, version=None, **kwargs):
+        """
+        Get the reference data bundle of a POS session
+        
+        Parameters:
+        - api_key (required): API authentication key
+        - session_id (required): ID of the POS session
+        - version: Version token of a cached bundle (or send it as If-None-Match)
+        
+        Returns JSON with the session's config, UoMs, currencies, taxes,
+        fiscal positions and payment methods, plus a version token. When the
+        given version is still current, returns 304 Not Modified with no body.
+        """
+        try:
+            # Authenticate
+            config = self._authenticate(api_key)
+            if not config:
+                return self._json_response(
+                    None,
+                    status=401,
+                    error='Invalid or missing API key'
+                )
+            
+            with self._profile_request(config, '/api/v1/pos/bootstrap', request.params):
+                if not session_id:
+                    return self._json_response(
+                        None,
+                        status=400,
+                        error='session_id is required'
+                    )
                 
-                products = []
-                for seller in supplier_infos:
-                    # Get product from supplierinfo
-                    product = seller.product_id or (seller.product_tmpl_id.product_variant_id if seller.product_tmpl_id else None)
-                    if product:
-                        products.append({
-                            'id': product.id,
-                            'name': product.name or '',
-                            'product_code': seller.product_code or '',
-                            'price': float(seller.price) if seller.price else 0.0,
-                            'min_qty': float(seller.min_qty) if seller.min_qty else 0.0,
-                            'delay': int(seller.delay) if seller.delay else 0,
-                            'currency_id': {
-                                'id': seller.currency_id.id if seller.currency_id else None,
-                                'name': seller.currency_id.name if seller.currency_id else None,
-                            },
-                        })
+                try:
+                    session_id = int(session_id)
+                except ValueError:
+                    return self._json_response(
+                        None,
+                        status=400,
+                        error=f'Invalid session_id: {session_id}'
+                    )
                 
-                # Get fiscal position and tax information
-                fiscal_position = vendor.property_account_position_id
-                fiscal_position_data = None
-                tax_mappings = []
+                pos_session = request.env['pos.session'].sudo().browse(session_id)
+                if not pos_session.exists():
+                    return self._json_response(
+                        None,
+                        status=404,
+                        error=f'POS session {session_id} not found'
+                    )
                 
-                if fiscal_position:
-                    fiscal_position_data = {
-                        'id': fiscal_position.id,
-                        'name': fiscal_position.name or '',
-                        'active': fiscal_position.active,
-                    }
-                    
-                    # Get tax mappings from fiscal position
-                    for tax_mapping in fiscal_position.tax_ids:
-                        tax_mapping_data = {
-                            'tax_source': {
-                                'id': tax_mapping.tax_src_id.id if tax_mapping.tax_src_id else None,
-                                'name': tax_mapping.tax_src_id.name if tax_mapping.tax_src_id else '',
-                                'amount': float(tax_mapping.tax_src_id.amount) if tax_mapping.tax_src_id and tax_mapping.tax_src_id.amount else 0.0,
-                                'amount_type': tax_mapping.tax_src_id.amount_type if tax_mapping.tax_src_id else '',
-                                'type_tax_use': tax_mapping.tax_src_id.type_tax_use if tax_mapping.tax_src_id else '',
-                            },
-                            'tax_destination': None,
-                        }
-                        
-                        if tax_mapping.tax_dest_id:
-                            tax_mapping_data['tax_destination'] = {
-                                'id': tax_mapping.tax_dest_id.id,
-                                'name': tax_mapping.tax_dest_id.name or '',
-                                'amount': float(tax_mapping.tax_dest_id.amount) if tax_mapping.tax_dest_id.amount else 0.0,
-                                'amount_type': tax_mapping.tax_dest_id.amount_type or '',
-                                'type_tax_use': tax_mapping.tax_dest_id.type_tax_use or '',
-                                'active': tax_mapping.tax_dest_active,
-                            }
-                        
-                        tax_mappings.append(tax_mapping_data)
+                bundle_version = self._get_pos_bootstrap_version(pos_session)
+                etag = f'"{bundle_version}"'
+                cache_headers = [
+                    ('ETag', etag),
+                    # Terminals may keep the bundle indefinitely but must revalidate before use
+                    ('Cache-Control', 'private, no-cache'),
+                ]
                 
-                vendor_data = {
-                    'id': vendor.id,
-                    'name': vendor.name,
-                    'display_name': vendor.display_name,
-                    'ref': vendor.ref or '',
-                    'vat': vendor.vat or '',
-                    'vat_number': vendor.vat or '',  # Explicit VAT number field
-                    'company_registry': vendor.company_registry or '',  # Company registry number
-                    'email': vendor.email or '',
-                    'phone': vendor.phone or '',
-                    'mobile': vendor.mobile or '',
-                    'website': vendor.website or '',
-                    'street': vendor.street or '',
-                    'street2': vendor.street2 or '',
-                    'city': vendor.city or '',
-                    'state_id': {
-                        'id': vendor.state_id.id if vendor.state_id else None,
-                        'name': vendor.state_id.name if vendor.state_id else None,
-                        'code': vendor.state_id.code if vendor.state_id else None,
-                    },
-                    'zip': vendor.zip or '',
-                    'country_id': {
-                        'id': vendor.country_id.id if vendor.country_id else None,
-                        'name': vendor.country_id.name if vendor.country_id else None,
-                        'code': vendor.country_id.code if vendor.country_id else None,
-                    },
-                    'supplier_rank': vendor.supplier_rank,
-                    'active': vendor.active,
-                    'fiscal_position': fiscal_position_data,
-                    'tax_mappings': tax_mappings,
-                    'products': products,
-                }
+                client_version = version or request.httprequest.headers.get('If-None-Match', '')
+                if client_version.strip('"') == bundle_version:
+                    return request.make_response('', headers=cache_headers, status=304)
                 
-                # Add image if available
-                if vendor.image_1920:
-                    vendor_data['image_url'] = f'/web/image/res.partner/{vendor.id}/image_1920'
+                data = self._get_pos_bootstrap_data(pos_session)
+                data['version'] = bundle_version
                 
-                data.append(vendor_data)
-            
-            return self._json_response(data)
+                return self._json_response(data, headers=cache_headers)
             
         except Exception as e:
-            _logger.error(f"Error in get_vendors: {str(e)}")
+            _logger.error(f"Error in get_pos_bootstrap: {str(e)}")
             return self._json_response(
                 None,
                 status=500,
                 error=f'Internal server error: {str(e)}'
             )
 
+    def _create_pos_order_with_retry(self, session_id, order_vals, mark_paid):
+        """
+        Create a POS order, retrying when it collides with concurrent orders
+        
+        Orders posted to the same session compete for the session and
+        sequence rows. On a serialization failure, deadlock or lock timeout
+        the transaction is rolled back and the order is created again after
+        a jittered exponential backoff. The last error is re-raised once
+        MAX_TRIES_ON_CONCURRENCY_FAILURE is reached. Raises ValidationError
+        if the session is no longer open when retrying.
+        
+        Returns a tuple (pos_order, number of retries).
+        """
+        for tries in range(1, MAX_TRIES_ON_CONCURRENCY_FAILURE + 1):
+            if tries > 1:
+                # The new snapshot may show the session closed by a concurrent transaction
+                pos_session = request.env['pos.session'].sudo().browse(session_id)
+                if pos_session.state not in ['opened', 'opening_control']:
+                    raise ValidationError(
+                        f'POS session {pos_session.name} is not open (state: {pos_session.state})')
+            try:
+                # create() may alter the one2many commands, keep the original intact for retries
+                pos_order = request.env['pos.order'].sudo().create(copy.deepcopy(order_vals))
+                if mark_paid:
+                    pos_order.action_pos_order_paid()
+                # Flush pending writes so conflicts surface inside the retry loop
+                request.env.flush_all()
+            except PG_CONCURRENCY_EXCEPTIONS_TO_RETRY as e:
+                # The whole transaction must go: with repeatable read a savepoint keeps the stale snapshot.
+                # Like odoo.service.model.retrying, also drop the failed attempt's cache and registry changes
+                request.env.cr.rollback()
+                request.env.transaction.reset()
+                request.env.registry.reset_changes()
+                if tries >= MAX_TRIES_ON_CONCURRENCY_FAILURE:
+                    request.env['api.pos.contention'].sudo()._record(session_id, retries=tries - 1, failed=True)
+                    raise
+                wait = random.uniform(0.0, min(MAX_WAIT_BEFORE_RETRY, BASE_WAIT_BEFORE_RETRY * 2 ** tries))
+                _logger.info(f"Concurrency error on POS session {session_id} "
+                             f"({type(e).__name__}), retry {tries} in {wait:.3f}s")
+                time.sleep(wait)
+            else:
+                request.env['api.pos.contention'].sudo()._record(session_id, retries=tries - 1)
+                return pos_order, tries - 1
+
     @http.route('/api/v1/pos/orders', type='http', auth='none', methods=['GET', 'POST', 'OPTIONS'], csrf=False, cors='*')
     def create_pos_order(self, **kwargs):
         """
@@ -439,12 +1066,16 @@ class APIController(http.Controller):
         
         # Handle GET request - return endpoint info
         if request.httprequest.method == 'GET':
-            return self._json_response({
+            info = {
                 'endpoint': '/api/v1/pos/orders',
                 'methods': ['GET', 'POST'],
                 'description': 'Create POS Order from external API',
                 'usage': 'Send POST request with JSON body containing order data'
-            })
+            }
+            # Contention counters are only disclosed to authenticated callers
+            if kwargs.get('api_key') and self._authenticate(kwargs.get('api_key')):
+                info['contention'] = request.env['api.pos.contention'].sudo()._get_stats()
+            return self._json_response(info)
         
         # Handle POST request
         try:
@@ -462,181 +1093,196 @@ class APIController(http.Controller):
                 # Fallback to params if no body data
                 data = request.params
             
-            # Authenticate
+            # Authenticate, keeping the shared usage row out of the order transaction
             api_key = data.get('api_key') or kwargs.get('api_key')
-            config = self._authenticate(api_key)
+            config = self._authenticate(api_key, track_usage=False)
             if not config:
                 return self._json_response(
                     None,
                     status=401,
                     error='Invalid or missing API key'
                 )
+            self._update_usage_isolated(config)
             
-            # Validate required fields
-            if not data.get('session_id'):
-                return self._json_response(
-                    None,
-                    status=400,
-                    error='session_id is required'
-                )
-            
-            if not data.get('lines') or not isinstance(data.get('lines'), list):
-                return self._json_response(
-                    None,
-                    status=400,
-                    error='lines array is required with at least one product'
-                )
-            
-            if not data.get('payments') or not isinstance(data.get('payments'), list):
-                return self._json_response(
-                    None,
-                    status=400,
-                    error='payments array is required with at least one payment'
-                )
-            
-            # Get POS session
-            pos_session = request.env['pos.session'].sudo().browse(data['session_id'])
-            if not pos_session.exists():
-                return self._json_response(
-                    None,
-                    status=404,
-                    error=f'POS session {data["session_id"]} not found'
-                )
-            
-            if pos_session.state not in ['opened', 'opening_control']:
-                return self._json_response(
-                    None,
-                    status=400,
-                    error=f'POS session {pos_session.name} is not open (state: {pos_session.state})'
-                )
-            
-            # Prepare order data
-            order_vals = {
-                'session_id': pos_session.id,
-                'config_id': pos_session.config_id.id,
-                'company_id': pos_session.config_id.company_id.id,
-                'pricelist_id': pos_session.config_id.pricelist_id.id,
-                'fiscal_position_id': pos_session.config_id.default_fiscal_position_id.id if pos_session.config_id.default_fiscal_position_id else False,
-                'user_id': pos_session.user_id.id,
-                'date_order': data.get('date_order') or fields.Datetime.now(),
-                'partner_id': data.get('partner_id') or False,
-                'to_invoice': data.get('to_invoice', False),
-                'note': data.get('note', ''),
-            }
-            
-            # Process order lines
-            order_lines = []
-            for line_data in data['lines']:
-                if not line_data.get('product_id'):
-                    continue
+            with self._profile_request(config, '/api/v1/pos/orders', data):
+                # Validate required fields
+                if not data.get('session_id'):
+                    return self._json_response(
+                        None,
+                        status=400,
+                        error='session_id is required'
+                    )
+                
+                if not data.get('lines') or not isinstance(data.get('lines'), list):
+                    return self._json_response(
+                        None,
+                        status=400,
+                        error='lines array is required with at least one product'
+                    )
                 
-                product = request.env['product.product'].sudo().browse(line_data['product_id'])
-                if not product.exists():
+                if not data.get('payments') or not isinstance(data.get('payments'), list):
+                    return self._json_response(
+                        None,
+                        status=400,
+                        error='payments array is required with at least one payment'
+                    )
+                
+                # Get POS session
+                pos_session = request.env['pos.session'].sudo().browse(data['session_id'])
+                if not pos_session.exists():
                     return self._json_response(
                         None,
                         status=404,
-                        error=f'Product {line_data["product_id"]} not found'
+                        error=f'POS session {data["session_id"]} not found'
                     )
                 
-                qty = float(line_data.get('qty', 1.0))
-                price_unit = float(line_data.get('price_unit', product.list_price))
-                discount = float(line_data.get('discount', 0.0))
+                if pos_session.state not in ['opened', 'opening_control']:
+                    return self._json_response(
+                        None,
+                        status=400,
+                        error=f'POS session {pos_session.name} is not open (state: {pos_session.state})'
+                    )
                 
-                # Get tax information
-                taxes = product.taxes_id.filtered(lambda t: t.company_id.id == pos_session.config_id.company_id.id)
-                if order_vals.get('fiscal_position_id'):
-                    fiscal_position = request.env['account.fiscal.position'].sudo().browse(order_vals['fiscal_position_id'])
-                    taxes = fiscal_position.map_tax(taxes)
+                # Prepare order data
+                order_vals = {
+                    'session_id': pos_session.id,
+                    'config_id': pos_session.config_id.id,
+                    'company_id': pos_session.config_id.company_id.id,
+                    'pricelist_id': pos_session.config_id.pricelist_id.id,
+                    'fiscal_position_id': pos_session.config_id.default_fiscal_position_id.id if pos_session.config_id.default_fiscal_position_id else False,
+                    'user_id': pos_session.user_id.id,
+                    'date_order': data.get('date_order') or fields.Datetime.now(),
+                    'partner_id': data.get('partner_id') or False,
+                    'to_invoice': data.get('to_invoice', False),
+                    'note': data.get('note', ''),
+                }
                 
-                # Calculate tax amount using proper tax computation (with discount)
-                partner = request.env['res.partner'].browse(order_vals.get('partner_id')) if order_vals.get('partner_id') else False
-                tax_results = taxes.compute_all(
-                    price_unit * (1 - discount / 100.0), 
-                    pos_session.config_id.currency_id, 
-                    qty, 
-                    product=product, 
-                    partner=partner
-                )
-                price_subtotal = tax_results['total_excluded']
-                price_subtotal_incl = tax_results['total_included']
-                tax_amount = price_subtotal_incl - price_subtotal
+                # Process order lines
+                order_lines = []
+                for line_data in data['lines']:
+                    if not line_data.get('product_id'):
+                        continue
+                    
+                    product = request.env['product.product'].sudo().browse(line_data['product_id'])
+                    if not product.exists():
+                        return self._json_response(
+                            None,
+                            status=404,
+                            error=f'Product {line_data["product_id"]} not found'
+                        )
+                    
+                    qty = float(line_data.get('qty', 1.0))
+                    price_unit = float(line_data.get('price_unit', product.list_price))
+                    discount = float(line_data.get('discount', 0.0))
+                    
+                    # Get tax information
+                    taxes = product.taxes_id.filtered(lambda t: t.company_id.id == pos_session.config_id.company_id.id)
+                    if order_vals.get('fiscal_position_id'):
+                        fiscal_position = request.env['account.fiscal.position'].sudo().browse(order_vals['fiscal_position_id'])
+                        taxes = fiscal_position.map_tax(taxes)
+                    
+                    # Calculate tax amount using proper tax computation (with discount)
+                    partner = request.env['res.partner'].browse(order_vals.get('partner_id')) if order_vals.get('partner_id') else False
+                    tax_results = taxes.compute_all(
+                        price_unit * (1 - discount / 100.0), 
+                        pos_session.config_id.currency_id, 
+                        qty, 
+                        product=product, 
+                        partner=partner
+                    )
+                    price_subtotal = tax_results['total_excluded']
+                    price_subtotal_incl = tax_results['total_included']
+                    tax_amount = price_subtotal_incl - price_subtotal
+                    
+                    order_lines.append((0, 0, {
+                        'product_id': product.id,
+                        'qty': qty,
+                        'price_unit': price_unit,
+                        'discount': discount,
+                        'price_subtotal': price_subtotal,
+                        'price_subtotal_incl': price_subtotal_incl,
+                        'tax_ids': [(6, 0, taxes.ids)],
+                    }))
                 
-                order_lines.append((0, 0, {
-                    'product_id': product.id,
-                    'qty': qty,
-                    'price_unit': price_unit,
-                    'discount': discount,
-                    'price_subtotal': price_subtotal,
-                    'price_subtotal_incl': price_subtotal_incl,
-                    'tax_ids': [(6, 0, taxes.ids)],
-                }))
-            
-            if not order_lines:
-                return self._json_response(
-                    None,
-                    status=400,
-                    error='No valid order lines created'
-                )
-            
-            order_vals['lines'] = order_lines
-            
-            # Calculate order totals
-            total_amount = sum(line[2]['price_subtotal_incl'] for line in order_lines)
-            total_tax = sum(line[2]['price_subtotal_incl'] - line[2]['price_subtotal'] for line in order_lines)
-            
-            # Process payments
-            payment_lines = []
-            total_paid = 0.0
-            for payment_data in data['payments']:
-                if not payment_data.get('payment_method_id'):
-                    continue
+                if not order_lines:
+                    return self._json_response(
+                        None,
+                        status=400,
+                        error='No valid order lines created'
+                    )
+                
+                order_vals['lines'] = order_lines
+                
+                # Calculate order totals
+                total_amount = sum(line[2]['price_subtotal_incl'] for line in order_lines)
+                total_tax = sum(line[2]['price_subtotal_incl'] - line[2]['price_subtotal'] for line in order_lines)
+                
+                # Process payments
+                payment_lines = []
+                total_paid = 0.0
+                for payment_data in data['payments']:
+                    if not payment_data.get('payment_method_id'):
+                        continue
+                    
+                    payment_method = request.env['pos.payment.method'].sudo().browse(payment_data['payment_method_id'])
+                    if not payment_method.exists():
+                        return self._json_response(
+                            None,
+                            status=404,
+                            error=f'Payment method {payment_data["payment_method_id"]} not found'
+                        )
+                    
+                    amount = float(payment_data.get('amount', 0.0))
+                    total_paid += amount
+                    
+                    payment_lines.append((0, 0, {
+                        'payment_method_id': payment_method.id,
+                        'amount': amount,
+                    }))
                 
-                payment_method = request.env['pos.payment.method'].sudo().browse(payment_data['payment_method_id'])
-                if not payment_method.exists():
+                if not payment_lines:
                     return self._json_response(
                         None,
-                        status=404,
-                        error=f'Payment method {payment_data["payment_method_id"]} not found'
+                        status=400,
+                        error='No valid payment lines created'
                     )
                 
-                amount = float(payment_data.get('amount', 0.0))
-                total_paid += amount
+                order_vals['payment_ids'] = payment_lines
+                order_vals['amount_total'] = total_amount
+                order_vals['amount_tax'] = total_tax
+                order_vals['amount_paid'] = total_paid
+                order_vals['amount_return'] = max(0.0, total_paid - total_amount)
                 
-                payment_lines.append((0, 0, {
-                    'payment_method_id': payment_method.id,
-                    'amount': amount,
-                }))
-            
-            if not payment_lines:
-                return self._json_response(
-                    None,
-                    status=400,
-                    error='No valid payment lines created'
-                )
-            
-            order_vals['payment_ids'] = payment_lines
-            order_vals['amount_total'] = total_amount
-            order_vals['amount_tax'] = total_tax
-            order_vals['amount_paid'] = total_paid
-            order_vals['amount_return'] = max(0.0, total_paid - total_amount)
-            
-            # Create the POS order
-            pos_order = request.env['pos.order'].sudo().create(order_vals)
-            
-            # If order should be paid, set state to paid
-            if total_paid >= total_amount and data.get('state') != 'draft':
-                pos_order.action_pos_order_paid()
-            
-            # Return success response
-            return self._json_response({
-                'id': pos_order.id,
-                'name': pos_order.name,
-                'pos_reference': pos_order.pos_reference,
-                'amount_total': pos_order.amount_total,
-                'amount_paid': pos_order.amount_paid,
-                'state': pos_order.state,
-                'date_order': str(pos_order.date_order),
-            })
+                # Create the POS order, paying it if fully paid and not kept as draft
+                mark_paid = total_paid >= total_amount and data.get('state') != 'draft'
+                try:
+                    pos_order, retries = self._create_pos_order_with_retry(pos_session.id, order_vals, mark_paid)
+                except ValidationError as e:
+                    return self._json_response(
+                        None,
+                        status=400,
+                        error=str(e)
+                    )
+                except PG_CONCURRENCY_EXCEPTIONS_TO_RETRY as e:
+                    _logger.warning(f"POS session {data['session_id']} is busy, giving up after "
+                                    f"{MAX_TRIES_ON_CONCURRENCY_FAILURE} tries: {str(e)}")
+                    return self._json_response(
+                        None,
+                        status=503,
+                        error=f'POS session {data["session_id"]} is busy, please retry the order'
+                    )
+                
+                # Return success response
+                return self._json_response({
+                    'id': pos_order.id,
+                    'name': pos_order.name,
+                    'pos_reference': pos_order.pos_reference,
+                    'amount_total': pos_order.amount_total,
+                    'amount_paid': pos_order.amount_paid,
+                    'state': pos_order.state,
+                    'date_order': str(pos_order.date_order),
+                    'retries': retries,
+                })
             
         except Exception as e:
             _logger.error(f"Error creating POS order: {str(e)}", exc_info=True)
@@ -646,11 +1292,137 @@ class APIController(http.Controller):
                 error=f'Internal server error: {str(e)}'
             )
 
+    def _get_health_data(self, **kwargs):
+        """Health check payload"""
+        return {
+            'message': 'API is running',
+            'version': '1.0',
+        }
+
     @http.route('/api/v1/health', type='http', auth='none', methods=['GET'], csrf=False, cors='*')
     def health_check(self, **kwargs):
         """Health check endpoint"""
-        return self._json_response({
-            'message': 'API is running',
-            'version': '1.0',
-        })
+        return self._json_response(self._get_health_data())
+
+    def _run_batch_requests(self, sub_requests):
+        """Run the sub-requests of a batch on the current cursor, return their results"""
+        results = []
+        for index, sub_request in enumerate(sub_requests):
+            sub_request = sub_request if isinstance(sub_request, dict) else {}
+            path = sub_request.get('path')
+            params = sub_request.get('params') or {}
+            result = {
+                'id': sub_request.get('id', index),
+                'path': path,
+                'status': 'success',
+                'data': None,
+                'error': None,
+                'count': 0,
+            }
+            
+            handler_name = BATCH_HANDLERS.get(path)
+            if not handler_name:
+                result.update(status='error', error=f'Unsupported batch path: {path}')
+            elif not isinstance(params, dict):
+                result.update(status='error', error='params must be an object')
+            else:
+                try:
+                    # Isolate each sub-request so one failure does not abort the others
+                    with request.env.cr.savepoint():
+                        sub_data = getattr(self, handler_name)(**params)
+                    result.update(
+                        data=sub_data,
+                        count=len(sub_data) if isinstance(sub_data, list) else (1 if sub_data else 0),
+                    )
+                except (psycopg2.OperationalError, psycopg2.InterfaceError):
+                    # Database failure, not a sub-request error: let _read_from_replica fall back
+                    raise
+                except (ValidationError, ValueError) as e:
+                    # Invalid parameters, reported like the standalone endpoint's 400
+                    _logger.warning(f"Invalid batch sub-request {path}: {str(e)}")
+                    result.update(status='error', error=str(e))
+                except Exception as e:
+                    _logger.error(f"Error in batch sub-request {path}: {str(e)}")
+                    result.update(status='error', error=f'Internal server error: {str(e)}')
+            
+            results.append(result)
+        
+        return results
+
+    @http.route('/api/v1/batch', type='http', auth='none', methods=['POST'], csrf=False, cors='*')
+    def batch(self, **kwargs):
+        """
+        Run several read endpoints in one round trip
+        
+        The API key is checked once and all sub-requests run on one cursor,
+        on the read replica when usable, so they share a single transaction
+        and database snapshot.
+        
+        Expected JSON format:
+        {
+            "api_key": "your-api-key",
+            "requests": [
+                {"id": "uom", "path": "/api/v1/uom"},
+                {"id": "products", "path": "/api/v1/products", "params": {"limit": 50}},
+                {"id": "vendors", "path": "/api/v1/vendors", "params": {"active_only": "false"}},
+                {"id": "health", "path": "/api/v1/health"}
+            ]
+        }
+        
+        Returns one result per sub-request, in the same order, each with its
+        own id, path, status, data, error and count.
+        """
+        try:
+            # Get JSON data from request body
+            if request.httprequest.data:
+                try:
+                    data = json.loads(request.httprequest.data.decode('utf-8'))
+                except (ValueError, UnicodeDecodeError) as e:
+                    return self._json_response(
+                        None,
+                        status=400,
+                        error=f'Invalid JSON format: {str(e)}'
+                    )
+            else:
+                data = request.params
+            
+            # Authenticate once for the whole batch, tracking usage outside the request transaction
+            api_key = data.get('api_key') or kwargs.get('api_key')
+            config = self._authenticate(api_key, track_usage=False)
+            if not config:
+                return self._json_response(
+                    None,
+                    status=401,
+                    error='Invalid or missing API key'
+                )
+            self._update_usage_isolated(config)
+            
+            with self._profile_request(config, '/api/v1/batch', data):
+                sub_requests = data.get('requests')
+                if not sub_requests or not isinstance(sub_requests, list):
+                    return self._json_response(
+                        None,
+                        status=400,
+                        error='requests array is required with at least one sub-request'
+                    )
+                
+                if len(sub_requests) > MAX_BATCH_REQUESTS:
+                    return self._json_response(
+                        None,
+                        status=400,
+                        error=f'A batch may contain at most {MAX_BATCH_REQUESTS} sub-requests'
+                    )
+                
+                # One cursor for the whole batch keeps a single snapshot, on the replica when usable
+                results = self._read_from_replica(self._run_batch_requests, sub_requests=sub_requests)
+                
+                return self._json_response(results)
+            
+        except Exception as e:
+            _logger.error(f"Error in batch: {str(e)}", exc_info=True)
+            return self._json_response(
+                None,
+                status=500,
+                error=f'Internal server error: {str(e)}'
+            )
 
@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 
 from . import api_config
+from . import api_pos_contention
+from . import api_request_profile
 from . import res_config_settings
-
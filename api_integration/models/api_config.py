@@ -1,6 +1,10 @@
 # -*- coding: utf-8 -*-
 
+import base64
+import random
 import secrets
+from datetime import timedelta
+
 from odoo import models, fields, api, _
 from odoo.exceptions import ValidationError
 
@@ -19,6 +23,37 @@ class APIConfig(models.Model):
     last_used = fields.Datetime(string='Last Used', readonly=True)
     usage_count = fields.Integer(string='Usage Count', default=0, readonly=True)
 
+    # Request profiling
+    profiling_enabled = fields.Boolean(string='Profile Requests', default=False,
+                                       help='Record a profile (Python stack, SQL queries with timings) of requests made with this API key.')
+    profiling_endpoint = fields.Char(string='Profiled Endpoint',
+                                     help='Only profile requests to this path, e.g. /api/v1/vendors. Leave empty to profile all endpoints.')
+    profiling_sample_rate = fields.Float(string='Sampling Rate', default=1.0,
+                                         help='Share of matching requests to profile, from 0 (none) to 1 (all).')
+    profiling_until = fields.Datetime(string='Profile Until',
+                                      help='Profiling stops automatically after this date.')
+    profile_max_count = fields.Integer(string='Profiles Kept', default=20,
+                                       help='Maximum number of profiles kept for this API key, oldest are deleted first.')
+    profile_retention_days = fields.Integer(string='Profile Retention (Days)', default=7,
+                                            help='Profiles older than this are deleted.')
+    profile_ids = fields.One2many('api.request.profile', 'config_id', string='Request Profiles',
+                                  groups='base.group_system')
+    profile_count = fields.Integer(string='Profiles', compute='_compute_profile_count',
+                                   groups='base.group_system')
+
+    @api.constrains('profiling_sample_rate')
+    def _check_profiling_sample_rate(self):
+        """Sampling rate must be a fraction"""
+        for record in self:
+            if not 0.0 <= record.profiling_sample_rate <= 1.0:
+                raise ValidationError(_('The sampling rate must be between 0 and 1.'))
+
+    @api.depends('profile_ids')
+    def _compute_profile_count(self):
+        """Compute number of stored profiles"""
+        for record in self:
+            record.profile_count = len(record.profile_ids)
+
     @api.model
     def create(self, vals):
         """Generate API key on creation"""
@@ -52,4 +87,55 @@ class APIConfig(models.Model):
             'usage_count': self.usage_count + 1,
         })
 
+    def _should_profile(self, endpoint):
+        """Decide whether a request to the given endpoint must be profiled"""
+        self.ensure_one()
+        if not self.profiling_enabled:
+            return False
+        if self.profiling_until and self.profiling_until < fields.Datetime.now():
+            return False
+        if self.profiling_endpoint and self.profiling_endpoint.strip() != endpoint:
+            return False
+        return random.random() < self.profiling_sample_rate
 
+    def _store_profile(self, endpoint, profile_json, duration=None, error=None):
+        """Save a request profile and apply the retention limits"""
+        self.ensure_one()
+        now = fields.Datetime.now()
+        self.env['api.request.profile'].sudo().create({
+            'config_id': self.id,
+            'endpoint': endpoint,
+            'duration': duration or 0.0,
+            'error': error,
+            'profile_file': base64.b64encode(profile_json.encode('utf-8')),
+            'profile_filename': f"profile_{endpoint.strip('/').replace('/', '_')}_{now.strftime('%Y%m%d_%H%M%S')}.json",
+        })
+        self._apply_profile_retention()
+
+    def _apply_profile_retention(self):
+        """Delete the profiles exceeding the retention limits of each configuration"""
+        now = fields.Datetime.now()
+        for record in self.sudo():
+            profiles = record.profile_ids.sorted(lambda profile: (profile.create_date, profile.id), reverse=True)
+            expired = profiles[max(record.profile_max_count, 1):]
+            if record.profile_retention_days > 0:
+                cutoff = now - timedelta(days=record.profile_retention_days)
+                expired |= profiles.filtered(lambda profile: profile.create_date < cutoff)
+            expired.unlink()
+
+    @api.autovacuum
+    def _gc_profiles(self):
+        """Prune request profiles of every configuration, including archived ones"""
+        self.with_context(active_test=False).search([])._apply_profile_retention()
+
+    def action_view_profiles(self):
+        """Open the stored request profiles"""
+        self.ensure_one()
+        return {
+            'type': 'ir.actions.act_window',
+            'name': _('Request Profiles'),
+            'res_model': 'api.request.profile',
+            'view_mode': 'list,form',
+            'domain': [('config_id', '=', self.id)],
+            'context': {'create': False},
+        }
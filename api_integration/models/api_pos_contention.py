@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+
+from datetime import timedelta
+
+from odoo import models, fields, api
+
+
+class APIPosContention(models.Model):
+    """Concurrency retries and failures of API POS orders
+
+    One row is inserted per contended order rather than updating a counter,
+    so that recording contention cannot itself collide between terminals.
+    """
+    _name = 'api.pos.contention'
+    _description = 'API POS Order Contention'
+    _order = 'id desc'
+
+    # Days after which contention records are removed by the autovacuum
+    _retention_days = 30
+
+    session_id = fields.Many2one('pos.session', string='POS Session', required=True, index=True, ondelete='cascade')
+    retries = fields.Integer(string='Retries', default=0)
+    failed = fields.Boolean(string='Failed', default=False,
+                            help='The order was not created because retries were exhausted.')
+
+    @api.model
+    def _record(self, session_id, retries=0, failed=False):
+        """Record the outcome of an order, only when it had to be retried or failed"""
+        if retries or failed:
+            self.create({
+                'session_id': session_id,
+                'retries': retries,
+                'failed': failed,
+            })
+
+    @api.model
+    def _get_stats(self):
+        """Return contention counters keyed by POS session id, summed over all workers"""
+        stats = {}
+        for session, failed, count, retries in self._read_group(
+            [],
+            groupby=['session_id', 'failed'],
+            aggregates=['__count', 'retries:sum'],
+        ):
+            session_stats = stats.setdefault(str(session.id), {'contended_orders': 0, 'retries': 0, 'failures': 0})
+            session_stats['contended_orders'] += count
+            session_stats['retries'] += retries
+            if failed:
+                session_stats['failures'] += count
+        return stats
+
+    @api.autovacuum
+    def _gc_old_records(self):
+        """Remove contention records older than the retention period"""
+        cutoff = fields.Datetime.now() - timedelta(days=self._retention_days)
+        self.search([('create_date', '<', cutoff)]).unlink()
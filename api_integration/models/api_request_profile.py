@@ -0,0 +1,25 @@
+# -*- coding: utf-8 -*-
+
+from odoo import models, fields
+
+
+class APIRequestProfile(models.Model):
+    """Request profile recorded for an API configuration
+
+    Profiles contain request bodies and every SQL statement with its
+    parameters, so this model is only accessible to system administrators.
+    The profile file is an attachment of this model, which makes it follow
+    the same access rights.
+    """
+    _name = 'api.request.profile'
+    _description = 'API Request Profile'
+    _order = 'create_date desc, id desc'
+    _rec_name = 'profile_filename'
+
+    config_id = fields.Many2one('api.config', string='API Configuration', required=True, index=True,
+                                ondelete='cascade', readonly=True)
+    endpoint = fields.Char(string='Endpoint', required=True, readonly=True)
+    duration = fields.Float(string='Duration (s)', readonly=True)
+    error = fields.Char(string='Error', readonly=True)
+    profile_file = fields.Binary(string='Profile', attachment=True, readonly=True)
+    profile_filename = fields.Char(string='File Name', readonly=True)
@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+"""
+POS Order API concurrency stress test
+
+Fires N orders in parallel at a single POS session through
+/api/v1/pos/orders and reports throughput, latency, retry and failure
+rates. Intended for local or staging databases only: every successful
+request creates a real POS order.
+
+Usage:
+    python pos_order_stress.py --url http://localhost:8069 --api-key KEY \\
+        --session-id 1 --product-id 1 --payment-method-id 1 \\
+        --orders 200 --concurrency 20
+"""
+
+import argparse
+import json
+import time
+import urllib.error
+import urllib.request
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+
+def post_order(url, payload, timeout):
+    """Post one order, return (http status, response body, elapsed seconds)"""
+    body = json.dumps(payload).encode('utf-8')
+    req = urllib.request.Request(url, data=body, headers={'Content-Type': 'application/json'}, method='POST')
+    start = time.monotonic()
+    try:
+        with urllib.request.urlopen(req, timeout=timeout) as response:
+            status, raw = response.status, response.read()
+    except urllib.error.HTTPError as e:
+        status, raw = e.code, e.read()
+    except (urllib.error.URLError, OSError) as e:
+        return None, {'error': str(e)}, time.monotonic() - start
+    elapsed = time.monotonic() - start
+    try:
+        data = json.loads(raw.decode('utf-8'))
+    except ValueError:
+        data = {'error': raw[:200].decode('utf-8', 'replace')}
+    return status, data, elapsed
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of a list of numbers"""
+    if not values:
+        return 0.0
+    values = sorted(values)
+    index = max(0, min(len(values) - 1, int(round(pct / 100.0 * len(values))) - 1))
+    return values[index]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Stress test concurrent POS order creation on one session')
+    parser.add_argument('--url', default='http://localhost:8069', help='Odoo base URL')
+    parser.add_argument('--api-key', required=True)
+    parser.add_argument('--session-id', type=int, required=True, help='ID of an open POS session')
+    parser.add_argument('--product-id', type=int, required=True)
+    parser.add_argument('--payment-method-id', type=int, required=True)
+    parser.add_argument('--price', type=float, default=10.0, help='Unit price; paid amount is padded to cover taxes')
+    parser.add_argument('--orders', type=int, default=100, help='Total number of orders to post')
+    parser.add_argument('--concurrency', type=int, default=10, help='Number of parallel requests')
+    parser.add_argument('--timeout', type=float, default=60.0, help='Per-request timeout in seconds')
+    args = parser.parse_args()
+
+    endpoint = args.url.rstrip('/') + '/api/v1/pos/orders'
+    payload = {
+        'api_key': args.api_key,
+        'session_id': args.session_id,
+        'lines': [{'product_id': args.product_id, 'qty': 1.0, 'price_unit': args.price}],
+        'payments': [{'payment_method_id': args.payment_method_id, 'amount': args.price * 2}],
+        'note': 'pos_order_stress',
+    }
+
+    start = time.monotonic()
+    with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+        results = list(executor.map(lambda _: post_order(endpoint, payload, args.timeout), range(args.orders)))
+    wall_time = time.monotonic() - start
+
+    statuses = Counter(status for status, _data, _elapsed in results)
+    succeeded = [(data, elapsed) for status, data, elapsed in results if status == 200]
+    retries = [(data.get('data') or {}).get('retries', 0) for data, _elapsed in succeeded]
+    latencies = [elapsed for _status, _data, elapsed in results]
+    errors = Counter(data.get('error') for status, data, _elapsed in results if status != 200)
+
+    print(f'Orders posted:      {args.orders} ({args.concurrency} in parallel) on session {args.session_id}')
+    print(f'Wall time:          {wall_time:.2f}s')
+    print(f'Throughput:         {len(succeeded) / wall_time:.2f} orders/s' if wall_time else 'Throughput: n/a')
+    print(f'Status codes:       {dict(statuses)}')
+    print(f'Succeeded:          {len(succeeded)} ({100.0 * len(succeeded) / args.orders:.1f}%)')
+    print(f'Retried orders:     {sum(1 for r in retries if r)} '
+          f'({100.0 * sum(1 for r in retries if r) / max(len(succeeded), 1):.1f}% of successes)')
+    print(f'Total retries:      {sum(retries)} (max {max(retries, default=0)} on one order)')
+    print(f'Latency p50/p95/max: {percentile(latencies, 50):.3f}s / {percentile(latencies, 95):.3f}s / '
+          f'{max(latencies, default=0.0):.3f}s')
+    for error, count in errors.most_common(5):
+        print(f'  {count} x {error}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,5 @@
+# -*- coding: utf-8 -*-
+
+from . import test_batch
+from . import test_pos_bootstrap
+from . import test_stock
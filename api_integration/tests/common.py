@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+
+import json
+from urllib.parse import urlencode
+
+from odoo.tests import HttpCase
+
+
+class APIIntegrationCommon:
+    """Helpers to call the API endpoints with an active API key, mixed into HttpCase classes"""
+
+    @classmethod
+    def setup_api_key(cls):
+        cls.api_config = cls.env['api.config'].create({'name': 'Test API Key'})
+        cls.api_key = cls.api_config.api_key
+
+    def api_get(self, path, headers=None, **params):
+        """GET an API endpoint with the test API key, return the response"""
+        params.setdefault('api_key', self.api_key)
+        return self.url_open(f'{path}?{urlencode(params)}', headers=headers)
+
+    def api_post(self, path, payload):
+        """POST a JSON payload with the test API key, return the response"""
+        payload.setdefault('api_key', self.api_key)
+        return self.url_open(
+            path,
+            data=json.dumps(payload),
+            headers={'Content-Type': 'application/json'},
+        )
+
+
+class APIIntegrationHttpCase(APIIntegrationCommon, HttpCase):
+    """Base class for API endpoint tests"""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.setup_api_key()
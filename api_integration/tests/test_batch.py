@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+
+from odoo.tests import tagged
+
+from .common import APIIntegrationHttpCase
+
+
+@tagged('post_install', '-at_install')
+class TestBatch(APIIntegrationHttpCase):
+
+    def test_batch_requires_api_key(self):
+        response = self.api_post('/api/v1/batch', {'api_key': 'invalid', 'requests': [{'path': '/api/v1/health'}]})
+        self.assertEqual(response.status_code, 401)
+
+    def test_batch_requires_requests(self):
+        response = self.api_post('/api/v1/batch', {'requests': []})
+        self.assertEqual(response.status_code, 400)
+
+    def test_batch_rejects_too_many_requests(self):
+        response = self.api_post('/api/v1/batch', {'requests': [{'path': '/api/v1/health'}] * 21})
+        self.assertEqual(response.status_code, 400)
+
+    def test_batch_dispatch(self):
+        uom_count = self.env['uom.uom'].search_count([])
+        response = self.api_post('/api/v1/batch', {'requests': [
+            {'id': 'health', 'path': '/api/v1/health'},
+            {'id': 'uom', 'path': '/api/v1/uom', 'params': {'limit': 2}},
+            {'id': 'unknown', 'path': '/api/v1/unknown'},
+            {'id': 'bad_params', 'path': '/api/v1/uom', 'params': ['limit']},
+            {'path': '/api/v1/uom'},
+        ]})
+        self.assertEqual(response.status_code, 200)
+        body = response.json()
+        self.assertEqual(body['count'], 5)
+        health, uom, unknown, bad_params, all_uoms = body['data']
+        
+        self.assertEqual(health['status'], 'success')
+        self.assertEqual(health['data']['message'], 'API is running')
+        self.assertEqual(uom['status'], 'success')
+        self.assertEqual(uom['count'], min(2, uom_count))
+        self.assertEqual(unknown['status'], 'error')
+        self.assertIn('Unsupported batch path', unknown['error'])
+        self.assertEqual(bad_params['status'], 'error')
+        # Results without an id are identified by their position
+        self.assertEqual(all_uoms['id'], 4)
+        self.assertEqual(all_uoms['count'], uom_count)
+
+    def test_batch_invalid_params_are_client_errors(self):
+        response = self.api_post('/api/v1/batch', {'requests': [
+            {'id': 'stock', 'path': '/api/v1/stock', 'params': {'limit': -1}},
+            {'id': 'health', 'path': '/api/v1/health'},
+        ]})
+        self.assertEqual(response.status_code, 200)
+        stock, health = response.json()['data']
+        self.assertEqual(stock['status'], 'error')
+        self.assertEqual(stock['error'], 'Invalid limit: -1')
+        self.assertEqual(health['status'], 'success')
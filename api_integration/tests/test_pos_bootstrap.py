@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+
+from odoo.tests import tagged
+from odoo.addons.point_of_sale.tests.test_frontend import TestPointOfSaleHttpCommon
+
+from .common import APIIntegrationCommon
+
+
+@tagged('post_install', '-at_install')
+class TestPosBootstrap(APIIntegrationCommon, TestPointOfSaleHttpCommon):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.setup_api_key()
+        cls.main_pos_config.open_ui()
+        cls.pos_session = cls.main_pos_config.current_session_id
+
+    def test_bootstrap_parameters(self):
+        self.assertEqual(self.api_get('/api/v1/pos/bootstrap', api_key='invalid', session_id=self.pos_session.id).status_code, 401)
+        self.assertEqual(self.api_get('/api/v1/pos/bootstrap').status_code, 400)
+        self.assertEqual(self.api_get('/api/v1/pos/bootstrap', session_id='abc').status_code, 400)
+        self.assertEqual(self.api_get('/api/v1/pos/bootstrap', session_id=999999999).status_code, 404)
+
+    def test_bootstrap_bundle(self):
+        response = self.api_get('/api/v1/pos/bootstrap', session_id=self.pos_session.id)
+        self.assertEqual(response.status_code, 200)
+        data = response.json()['data']
+        
+        self.assertEqual(data['session']['id'], self.pos_session.id)
+        self.assertEqual(data['config']['id'], self.main_pos_config.id)
+        self.assertEqual(
+            {method['id'] for method in data['payment_methods']},
+            set(self.main_pos_config.payment_method_ids.ids),
+        )
+        self.assertEqual(len(data['uoms']), self.env['uom.uom'].search_count([]))
+        self.assertIn(self.main_pos_config.currency_id.id, [currency['id'] for currency in data['currencies']])
+        self.assertEqual(response.headers['ETag'], f'"{data["version"]}"')
+
+    def test_bootstrap_revalidation(self):
+        response = self.api_get('/api/v1/pos/bootstrap', session_id=self.pos_session.id)
+        etag = response.headers['ETag']
+        version = response.json()['data']['version']
+        
+        # Unchanged data: 304 without body, by header or by parameter
+        response = self.api_get('/api/v1/pos/bootstrap', headers={'If-None-Match': etag}, session_id=self.pos_session.id)
+        self.assertEqual(response.status_code, 304)
+        self.assertFalse(response.content)
+        self.assertEqual(response.headers['ETag'], etag)
+        response = self.api_get('/api/v1/pos/bootstrap', session_id=self.pos_session.id, version=version)
+        self.assertEqual(response.status_code, 304)
+        
+        # Changed reference data: full bundle with a new version
+        self.env['uom.uom'].create({
+            'name': 'API Test Dozen',
+            'category_id': self.env.ref('uom.product_uom_categ_unit').id,
+            'uom_type': 'bigger',
+            'factor_inv': 12.0,
+        })
+        response = self.api_get('/api/v1/pos/bootstrap', headers={'If-None-Match': etag}, session_id=self.pos_session.id)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response.headers['ETag'], etag)
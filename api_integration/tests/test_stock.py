@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+
+from odoo.tests import tagged
+
+from .common import APIIntegrationHttpCase
+
+
+@tagged('post_install', '-at_install')
+class TestStock(APIIntegrationHttpCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.warehouse = cls.env['stock.warehouse'].search([('company_id', '=', cls.env.company.id)], limit=1)
+        cls.stock_location = cls.warehouse.lot_stock_id
+        cls.products = cls.env['product.product'].create([
+            {'name': f'API Stock Product {index}', 'is_storable': True}
+            for index in range(3)
+        ])
+        quant_model = cls.env['stock.quant']
+        quant_model._update_available_quantity(cls.products[0], cls.stock_location, 10.0)
+        quant_model._update_available_quantity(cls.products[0], cls.stock_location, 5.0)
+        quant_model._update_available_quantity(cls.products[1], cls.stock_location, 3.0)
+        quant_model._update_reserved_quantity(cls.products[0], cls.stock_location, 4.0)
+        cls.product_ids = ','.join(str(product_id) for product_id in cls.products.ids)
+
+    def _get_stock(self, **params):
+        response = self.api_get('/api/v1/stock', product_ids=self.product_ids, **params)
+        self.assertEqual(response.status_code, 200)
+        return response.json()['data']
+
+    def test_stock_quantities(self):
+        data = self._get_stock(warehouse_id=self.warehouse.id)
+        quantities = {item['product_id']: item for item in data['quantities']}
+        self.assertEqual(list(quantities), self.products.ids)
+        
+        self.assertEqual(quantities[self.products[0].id]['quantity'], 15.0)
+        self.assertEqual(quantities[self.products[0].id]['reserved_quantity'], 4.0)
+        self.assertEqual(quantities[self.products[0].id]['available_quantity'], 11.0)
+        self.assertEqual(quantities[self.products[1].id]['available_quantity'], 3.0)
+        # Products without stock are returned with zero quantities
+        self.assertEqual(quantities[self.products[2].id]['quantity'], 0.0)
+        self.assertIsNone(data['next_cursor'])
+
+    def test_stock_location_filter(self):
+        other_location = self.env['stock.location'].create({
+            'name': 'API Other Shelf',
+            'usage': 'internal',
+            'location_id': self.warehouse.view_location_id.id,
+        })
+        data = self._get_stock(location_id=other_location.id)
+        self.assertTrue(all(item['quantity'] == 0.0 for item in data['quantities']))
+
+    def test_stock_cursor_paging(self):
+        first_page = self._get_stock(limit=2)
+        self.assertEqual([item['product_id'] for item in first_page['quantities']], self.products.ids[:2])
+        self.assertEqual(first_page['next_cursor'], self.products.ids[1])
+        
+        second_page = self._get_stock(limit=2, cursor=first_page['next_cursor'])
+        self.assertEqual([item['product_id'] for item in second_page['quantities']], self.products.ids[2:])
+        self.assertIsNone(second_page['next_cursor'])
+
+    def test_stock_updated_since(self):
+        data = self._get_stock(updated_since='2000-01-01 00:00:00')
+        # Only products whose quants changed, the product without stock is left out
+        self.assertEqual([item['product_id'] for item in data['quantities']], self.products.ids[:2])
+        self.assertTrue(data['server_time'])
+        
+        data = self._get_stock(updated_since='2100-01-01 00:00:00')
+        self.assertEqual(data['quantities'], [])
+        self.assertIsNone(data['next_cursor'])
+
+    def test_stock_invalid_parameters(self):
+        for params in ({'limit': 0}, {'limit': -5}, {'location_id': 999999999}, {'warehouse_id': 999999999},
+                       {'updated_since': 'yesterday'}, {'cursor': 'abc'}):
+            response = self.api_get('/api/v1/stock', **params)
+            self.assertEqual(response.status_code, 400, params)
+        self.assertEqual(self.api_get('/api/v1/stock', api_key='invalid').status_code, 401)